@@ -1,10 +1,32 @@
 import os
 import json
-from datetime import datetime
+import math
+import time
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._common import CATEGORIES
+
+# 진단용 출력 여부 (오류 메시지는 항상 출력)
+DEBUG = False
 
 # 파일 내부 전역 버스 (Master와 Slave가 공유)
 INTERNAL_PROJECT_BUS = {}
 
+def _has_nonfinite(obj):
+    """NaN/Infinity 포함 여부 (orjson은 null로 바꿔 기록하므로 이 경우 표준 json 사용)"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
 class ProjectMasterController:
     """데이터 생성 및 전역 채널 직접 송신 후 소켓 없이 종료하는 마스터 노드"""
     
@@ -20,14 +42,7 @@ class ProjectMasterController:
                 "archive_root": ("STRING", {"default": "output/Archive_Data"}),
                 "CHANNEL": ("STRING", {"default": "MASTER_CH"}),
             },
-            "optional": {
-                "01_Background": ("DICT",),
-                "02_Equipment": ("DICT",),
-                "03_Character": ("DICT",),
-                "04_Structure": ("DICT",),
-                "05_SpecialEffects": ("DICT",),
-                "06_Audio": ("DICT",),
-            }
+            "optional": {cat: ("DICT",) for cat in CATEGORIES}
         }
 
     RETURN_TYPES = ()
@@ -36,8 +51,8 @@ class ProjectMasterController:
     CATEGORY = "Universal_Pipeline/Management"
     
     def execute_management(self, project_name, asset_save_root, archive_root, CHANNEL, **kwargs):
-        now = datetime.now()
-        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        t = time.localtime()
+        timestamp = f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
         
         abs_asset_root = os.path.abspath(asset_save_root)
         project_base_path = os.path.join(abs_asset_root, project_name)
@@ -53,9 +68,15 @@ class ProjectMasterController:
         }
 
         # 2. 인프라 구축
-        categories = ["01_Background", "02_Equipment", "03_Character", "04_Structure", "05_SpecialEffects", "06_Audio"]
-        for cat in categories:
-            os.makedirs(os.path.join(project_base_path, cat), exist_ok=True)
+        os.makedirs(project_base_path, exist_ok=True)
+        with os.scandir(project_base_path) as it:
+            existing = {e.name for e in it if e.is_dir(follow_symlinks=False)}
+        for cat in CATEGORIES:
+            if cat in existing: continue
+            try:
+                os.mkdir(os.path.join(project_base_path, cat))
+            except FileExistsError:
+                pass
 
 # 3. 아카이브 저장 및 리스트 갱신
         abs_archive_root = os.path.abspath(archive_root)
@@ -65,12 +86,38 @@ class ProjectMasterController:
         file_name = f"{timestamp}_{project_name}.json"
         list_file = os.path.join(abs_archive_root, "archiving_list.txt")
 
-        with open(list_file, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] PROJ: {project_name} | FILE: {file_name}\n")
+        # 개별 아카이브 JSON 파일 저장 (직렬화 후 임시 파일에 기록, 교체하여 부분 기록 방지)
+        if orjson is not None and not _has_nonfinite(total_package):
+            payload = orjson.dumps(total_package, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(total_package, indent=2).encode("utf-8")
+
+        archive_path = os.path.join(arch_dir, file_name)
+        fd, tmp_path = tempfile.mkstemp(dir=arch_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 0600으로 생성하므로 기존 open()처럼 umask를 적용한 권한으로 맞춤
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
-        # 개별 아카이브 JSON 파일 저장
-        with open(os.path.join(arch_dir, file_name), "w", encoding="utf-8") as f:
-            json.dump(total_package, f, indent=4)
+        # 한 줄을 O_APPEND write()로 추가 (동시 실행 시에도 줄 단위로 섞이지 않음)
+        # 기존 텍스트 모드와 동일한 줄바꿈(Windows CRLF)을 쓰고, CRT 변환은 O_BINARY로 끔
+        line = f"[{timestamp}] PROJ: {project_name} | FILE: {file_name}{os.linesep}".encode("utf-8")
+        fd = os.open(list_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            view = memoryview(line)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
         # 4. 내부 버스에 데이터 등록
         INTERNAL_PROJECT_BUS[CHANNEL] = total_package
@@ -91,10 +138,7 @@ class SlaveDistributor:
 
     # 지시사항: 리턴 타입 6개 고정
     RETURN_TYPES = ("STRING", "STRING", "STRING", "STRING", "STRING", "STRING")
-    RETURN_NAMES = (
-        "01_Background", "02_Equipment", "03_Character", 
-        "04_Structure", "05_SpecialEffects", "06_Audio"
-    )
+    RETURN_NAMES = CATEGORIES
     FUNCTION = "distribute"
     CATEGORY = "Universal_Pipeline/Distributed_Control"
 
@@ -103,13 +147,23 @@ class SlaveDistributor:
         
         # 1. 데이터 참조 로직
         if reference_mode == "Archive":
-            if os.path.exists(archive_file_path):
-                try:
-                    with open(archive_file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        print(f"📦 [SLAVE] 아카이브 데이터 참조 성공: {archive_file_path}")
-                except Exception as e:
-                    print(f"❌ [SLAVE] 아카이브 로드 실패: {e}")
+            try:
+                with open(archive_file_path, "rb") as f:
+                    raw = f.read()
+                if orjson is not None:
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # NaN/Infinity가 기록된 기존(표준 json) 아카이브는 json으로 재시도
+                        data = json.loads(raw)
+                else:
+                    data = json.loads(raw)
+                if DEBUG:
+                    print(f"📦 [SLAVE] 아카이브 데이터 참조 성공: {archive_file_path}")
+            except FileNotFoundError:
+                print(f"⚠️ [SLAVE] 아카이브 파일이 존재하지 않습니다: {archive_file_path}")
+            except Exception as e:
+                print(f"❌ [SLAVE] 아카이브 로드 실패: {e}")
 
         if data is None:
             data = INTERNAL_PROJECT_BUS.get(CHANNEL)
@@ -120,33 +174,17 @@ class SlaveDistributor:
         project_info = data.get("project_info", {})
         settings = data.get("settings", {})
         
-        category_keys = [
-            "01_Background", "02_Equipment", "03_Character", 
-            "04_Structure", "05_SpecialEffects", "06_Audio"
-        ]
-        
-        output_list = []
-        for i in range(6):
-            integrated_dict = project_info.copy()
-            key = category_keys[i]
-            
-            # root 경로를 프로젝트경로/카테고리명으로 업데이트
-            if "root" in integrated_dict:
-                integrated_dict["root"] = os.path.join(integrated_dict["root"], key)
-            
-            # 카테고리별 데이터 병합
-            category_data = settings.get(key, {})
-            if category_data:
-                integrated_dict.update(category_data)
-            
-            # 리스트에 추가
-            output_list.append(integrated_dict)
-        
+        # root 경로를 프로젝트경로/카테고리명으로 업데이트한 뒤 카테고리별 데이터 병합
         # output_list에 6개의 항목 지정, 차후 동적 참조 추가 예정
-        return (
-            output_list[0], output_list[1], output_list[2], 
-            output_list[3], output_list[4], output_list[5]
-        )
+        if "root" in project_info:
+            root = project_info["root"]
+            output_list = [
+                {**project_info, "root": os.path.join(root, key), **(settings.get(key) or {})}
+                for key in CATEGORIES
+            ]
+        else:
+            output_list = [{**project_info, **(settings.get(key) or {})} for key in CATEGORIES]
+        return tuple(output_list)
 
 NODE_CLASS_MAPPINGS = {
     "ProjectMasterController": ProjectMasterController,
@@ -1,23 +1,22 @@
-import os
-import json
-import unicodedata
+import copy
+
 from . import global_channels
+from ._common import CATEGORIES
 
 class ReceiverNode:
+    # 입력 규격은 고정이므로 클래스 정의 시 한 번만 생성
+    _INPUTS = {
+        "required": {
+            "CHANNEL": ("STRING", {"default": "MASTER_CH"}),
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "CHANNEL": ("STRING", {"default": "MASTER_CH"}),
-            }
-        }
+        return s._INPUTS
 
     RETURN_TYPES = ("DICT", "DICT", "DICT", "DICT", "DICT", "DICT", "DICT", "STRING", "STRING")
-    RETURN_NAMES = (
-        "01_Background", "02_Equipment", "03_Character", 
-        "04_Structure", "05_SpecialEffects", "06_Audio",
-        "PROJECT_INFO", "PROJECT_NAME", "ASSET_ROOT"
-    )
+    RETURN_NAMES = CATEGORIES + ("PROJECT_INFO", "PROJECT_NAME", "ASSET_ROOT")
     FUNCTION = "execute_reception"
     CATEGORY = "Universal_Pipeline/Distributed_Control"
 
@@ -27,17 +26,18 @@ class ReceiverNode:
         if not data:
             return ({}, {}, {}, {}, {}, {}, {}, "NONE", "NONE")
 
-        # 데이터 추출
-        info = data.get("project_info", {})
-        settings = data.get("settings", {})
+        # 수신마다 별도 복사본을 사용하여 다른 수신 노드와 데이터를 공유하지 않음
+        try:
+            data = copy.deepcopy(data)
+        except (TypeError, copy.Error):
+            # 복사할 수 없는 객체가 있으면 채널의 참조 그대로 사용
+            pass
+
+        # 데이터 추출 (카테고리 순서는 RETURN_NAMES와 동일)
+        info = data.get("project_info") or {}
+        settings = data.get("settings") or {}
         
-        return (
-            settings.get("01_Background", {}),
-            settings.get("02_Equipment", {}),
-            settings.get("03_Character", {}),
-            settings.get("04_Structure", {}),
-            settings.get("05_SpecialEffects", {}),
-            settings.get("06_Audio", {}),
+        return tuple([settings.get(k) or {} for k in CATEGORIES]) + (
             info,
             info.get("name", "Unknown"),
             info.get("root", "")
@@ -1,18 +1,19 @@
-import os
-import json
-import unicodedata
+import copy
 
 from . import global_channels
 
 class SenderNode:
+    # 입력 규격은 고정이므로 클래스 정의 시 한 번만 생성
+    _INPUTS = {
+        "required": {
+            "MASTER_DATA": ("DICT",),
+            "CHANNEL": ("STRING", {"default": "MASTER_CH"}),
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(s):
-        return {
-            "required": {
-                "MASTER_DATA": ("DICT",),
-                "CHANNEL": ("STRING", {"default": "MASTER_CH"}),
-            }
-        }
+        return s._INPUTS
 
     RETURN_TYPES = ("DICT",)
     RETURN_NAMES = ("sent_data",)
@@ -20,7 +21,13 @@ class SenderNode:
     CATEGORY = "Universal_Pipeline/Distributed_Control"
 
     def execute_transmission(self, MASTER_DATA, CHANNEL):
-        global_channels.set_channel_data(CHANNEL, MASTER_DATA)
+        # 전송 시점의 복사본을 저장하여 이후 원본 변경이 채널에 전파되지 않도록 함
+        try:
+            snapshot = copy.deepcopy(MASTER_DATA)
+        except (TypeError, copy.Error):
+            # 복사할 수 없는 객체(lock, generator 등)가 있으면 원본 참조 그대로 저장
+            snapshot = MASTER_DATA
+        global_channels.set_channel_data(CHANNEL, snapshot)
         return (MASTER_DATA,)
 
 NODE_CLASS_MAPPINGS = {"SenderNode": SenderNode}
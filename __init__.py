@@ -1,10 +1,8 @@
 import os
 import json
 import importlib
-import unicodedata
 
 NODE_DIR = os.path.dirname(os.path.realpath(__file__))
-CATEGORIES = ["01_Background", "02_Equipment", "03_Character", "04_Structure", "05_SpecialEffects", "06_Audio"]
 
 # 초기 생성용 규격화 데이터
 DEFAULT_DATA = {
@@ -44,22 +42,25 @@ DEFAULT_DATA = {
 
 def initialize_modular_infra():
     """물리적 폴더 인식 및 초기 인프라(JSON/Txt) 구축"""
-    for cat in CATEGORIES:
-        cat_path = os.path.join(NODE_DIR, cat)
-        setting_base = os.path.join(cat_path, "setting")
-        category_presets = DEFAULT_DATA.get(cat, {})
+    join = os.path.join
+    for cat, category_presets in DEFAULT_DATA.items():
+        setting_base = join(NODE_DIR, cat, "setting")
         
+        os.makedirs(setting_base, exist_ok=True)
+
+        # setting 폴더를 한 번만 스캔하여 없는 항목만 생성 (이미 있으면 건드리지 않음)
+        with os.scandir(setting_base) as it:
+            existing = {e.name for e in it}
+
         for key, config_template in category_presets.items():
-            preset_folder = os.path.join(setting_base, key)
-            if not os.path.exists(preset_folder):
-                os.makedirs(preset_folder, exist_ok=True)
-                config_file = os.path.join(preset_folder, "config.json")
-                with open(config_file, "w", encoding="utf-8") as f:
-                    json.dump({key: config_template}, f, indent=4)
+            if key in existing: continue
+            preset_folder = join(setting_base, key)
+            os.mkdir(preset_folder)
+            with open(join(preset_folder, "config.json"), "w", encoding="utf-8") as f:
+                f.write(json.dumps({key: config_template}, indent=4))
 
-        order_file = os.path.join(setting_base, "order_list.txt")
-        if not os.path.exists(order_file):
-            with open(order_file, "w", encoding="utf-8") as f:
+        if "order_list.txt" not in existing:
+            with open(join(setting_base, "order_list.txt"), "w", encoding="utf-8") as f:
                 f.write("\n".join(category_presets.keys()))
 
 # 1. 인프라 초기화 실행
@@ -69,23 +70,24 @@ initialize_modular_infra()
 NODE_CLASS_MAPPINGS = {}
 NODE_DISPLAY_NAME_MAPPINGS = {}
 
-# 3. [복문] 각 카테고리 폴더에서 노드 클래스를 동적으로 임포트하여 매핑
-for cat in CATEGORIES:
+# 3. 세팅 노드 등록표 (카테고리, 모듈 경로, 클래스 이름, 표시 이름)
+#    폴더명이 숫자로 시작하므로 import 문 대신 importlib 사용
+_SETTING_NODES = (
+    ("01_Background", ".01_Background.01_Background_Setting_Node", "BackgroundSettingNode", "⚙️ 01_Background Setting"),
+    ("02_Equipment", ".02_Equipment.02_Equipment_Setting_Node", "EquipmentSettingNode", "⚙️ 02_Equipment Setting"),
+    ("03_Character", ".03_Character.03_Character_Setting_Node", "CharacterSettingNode", "⚙️ 03_Character Setting"),
+    ("04_Structure", ".04_Structure.04_Structure_Setting_Node", "StructureSettingNode", "⚙️ 04_Structure Setting"),
+    ("05_SpecialEffects", ".05_SpecialEffects.05_SpecialEffects_Setting_Node", "SpecialEffectsSettingNode", "⚙️ 05_SpecialEffects Setting"),
+    ("06_Audio", ".06_Audio.06_Audio_Setting_Node", "AudioSettingNode", "⚙️ 06_Audio Setting"),
+)
+
+for cat, module_path, class_name, display_name in _SETTING_NODES:
     try:
-        # 모듈 경로 예: .01_Background.01_Background_Setting_Node
-        module_path = f".{cat}.{cat}_Setting_Node"
-        # 클래스 이름 예: BackgroundSettingNode
-        class_name = f"{cat.split('_')[1]}SettingNode"
-        
-        # importlib을 이용한 동적 로드
         module = importlib.import_module(module_path, package=__name__)
-        node_class = getattr(module, class_name)
-        
-        # 매핑 등록
-        NODE_CLASS_MAPPINGS[class_name] = node_class
-        NODE_DISPLAY_NAME_MAPPINGS[class_name] = f"⚙️ {cat} Setting"
-        
-    except Exception as e:
+        NODE_CLASS_MAPPINGS[class_name] = getattr(module, class_name)
+        NODE_DISPLAY_NAME_MAPPINGS[class_name] = display_name
+    except ImportError as e:
+        # 카테고리 폴더/모듈이 없는 경우만 건너뜀 (그 외 오류는 그대로 노출)
         print(f"❌ [Infra] Failed to load {cat}: {e}")
 
 # __init__.py 하단 매핑 부분
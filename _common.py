@@ -0,0 +1,111 @@
+import os
+import json
+import unicodedata
+
+# 패키지 공용 카테고리 순서 (폴더명 = 소켓명)
+CATEGORIES = ("01_Background", "02_Equipment", "03_Character", "04_Structure", "05_SpecialEffects", "06_Audio")
+
+def _combo(c, s, v):
+    options = c.get("options", s)
+    # 폴더/파일 없을시 텍스트 입력창 제공
+    return (options,) if options else ("STRING", {"default": str(v)})
+
+# config.json의 type별 위젯 생성기 (그 외 type은 combo로 처리)
+_BUILDERS = {
+    "float": lambda c, s, v: ("FLOAT", {"default": v, "min": c.get("min", 0.0), "max": c.get("max", 1.0), "step": c.get("step", 0.01)}),
+    "int": lambda c, s, v: ("INT", {"default": v, "min": c.get("min", 0), "max": c.get("max", 100)}),
+    "string": lambda c, s, v: ("STRING", {"default": str(v)}),
+}
+
+def _stamp(st):
+    # mtime 해상도가 낮은 파일시스템(FAT/exFAT, HFS+)을 고려해 크기도 함께 비교
+    return (st.st_mtime_ns, st.st_size)
+
+def build_setting_inputs(scan_path, cache):
+    """setting 폴더를 스캔하여 세팅 노드 INPUT_TYPES의 required 항목 생성
+
+    cache는 노드 클래스별 dict로, order_list.txt와 항목별 위젯 규격을
+    (mtime, size) 기준으로 보관하여 변경이 없으면 재사용함
+    """
+    order_file = os.path.join(scan_path, "order_list.txt")
+
+    # 1. setting 폴더 1회 스캔 (order_list.txt 및 항목 폴더 확인)
+    try:
+        with os.scandir(scan_path) as it:
+            entries = {e.name: e for e in it}
+    except FileNotFoundError:
+        os.makedirs(scan_path, exist_ok=True)
+        entries = {}
+
+    # 2. order_list.txt에서 UI 목록 확보 (파일이 바뀐 경우에만 다시 읽음)
+    order_entry = entries.get("order_list.txt")
+    order_stamp = _stamp(order_entry.stat()) if order_entry is not None else None
+
+    cached_order = cache.get("order")
+    if cached_order is not None and cached_order[0] == order_stamp:
+        ui_keys = cached_order[1]
+    else:
+        ui_keys = []
+        try:
+            with open(order_file, "r", encoding="utf-8") as f:
+                for l in f:
+                    l = l.strip()
+                    if not l: continue
+                    # ASCII 키는 NFC 정규화 결과가 동일하므로 생략
+                    ui_keys.append(l if l.isascii() else unicodedata.normalize('NFC', l))
+        except FileNotFoundError:
+            pass
+        cache["order"] = (order_stamp, ui_keys)
+
+    specs = cache.setdefault("specs", {})
+    required_inputs = {"mode": (["Standard", "Variant", "Draft"],)}
+
+    # 3. [복문] 각 항목별 물리 폴더 및 JSON 데이터 대조
+    for key in ui_keys:
+        param_entry = entries.get(key)
+        if param_entry is None or not param_entry.is_dir():
+            # 폴더가 없으면 config도 없으므로 텍스트 입력창 제공
+            required_inputs[key] = ("STRING", {"default": "none"})
+            continue
+
+        config_path = os.path.join(param_entry.path, "config.json")
+
+        # 폴더와 config.json이 그대로면 이전 결과 재사용 (config 없음 = None)
+        try:
+            config_stamp = _stamp(os.stat(config_path))
+        except FileNotFoundError:
+            config_stamp = None
+
+        stamp = (_stamp(param_entry.stat()), config_stamp)
+        cached = specs.get(key)
+        if cached is not None and cached[0] == stamp:
+            required_inputs[key] = cached[1]
+            continue
+
+        # 실제 파일/폴더 스캔
+        sub_items = []
+        with os.scandir(param_entry.path) as it:
+            for e in it:
+                if not e.name.endswith(('.json', '.txt')):
+                    sub_items.append(e.name)
+
+        if config_stamp is not None:
+            try:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    conf_data = json.load(f).get(key, {})
+
+                w_type = conf_data.get("type", "combo")
+                val = conf_data.get("value", "none")
+                required_inputs[key] = _BUILDERS.get(w_type, _combo)(conf_data, sub_items, val)
+            except (OSError, ValueError, AttributeError, TypeError):
+                required_inputs[key] = (["config_error"],)
+        else:
+            # config가 없어도 폴더 내 파일이 있으면 드롭다운 출력
+            if sub_items:
+                required_inputs[key] = (sub_items,)
+            else:
+                required_inputs[key] = ("STRING", {"default": "none"})
+
+        specs[key] = (stamp, required_inputs[key])
+
+    return required_inputs
\ No newline at end of file
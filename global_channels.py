@@ -1,8 +1,11 @@
+import sys
+
 # 글로벌 채널 데이터 저장소
 GLOBAL_CHANNELS = {}
 
 def set_channel_data(channel_name, data):
-    GLOBAL_CHANNELS[channel_name] = data
+    # 채널명을 intern 하여 dict 조회 시 포인터 비교로 끝나도록 함
+    GLOBAL_CHANNELS[sys.intern(str(channel_name))] = data
 
 def get_channel_data(channel_name):
-    return GLOBAL_CHANNELS.get(channel_name)
\ No newline at end of file
+    return GLOBAL_CHANNELS.get(sys.intern(str(channel_name)))
\ No newline at end of file